@@ -0,0 +1,35 @@
+# Basic Python examples as an importable package
+# Helpers are loaded from their submodule the first time they are used, so
+# "from basic_python import check_grade" only imports control_structures.
+
+_EXPORTS = {
+    "check_grade": "control_structures",
+    "GradeTable": "control_structures",
+    "safe_divide": "control_structures",
+    "divide_many": "control_structures",
+    "DIVIDE_OK": "control_structures",
+    "DIVIDE_BY_ZERO": "control_structures",
+    "DIVIDE_INVALID": "control_structures",
+    "get_day_type": "control_structures",
+    "DayTypeClassifier": "control_structures",
+    "MAX_ATTEMPTS": "variables_and_data_types",
+    "PI": "variables_and_data_types",
+    "COMPANY_NAME": "variables_and_data_types",
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    """Import the submodule that defines name on first access"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ (unlike importlib.import_module) shows up in -X importtime
+    module = __import__(f"{__name__}.{module_name}", fromlist=[name])
+    value = getattr(module, name)
+    # Cache the value so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
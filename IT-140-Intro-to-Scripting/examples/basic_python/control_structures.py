@@ -1,6 +1,25 @@
 # Control Structures in Python
 # This script demonstrates if/else statements, loops, and other control flow
 
+import math
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from datetime import date
+from itertools import repeat
+from numbers import Real
+
+# NumPy is optional and never imported here: an input can only be a NumPy
+# array if the caller already imported NumPy, so importing this module
+# stays cheap.
+def _numpy_for(*values):
+    """Return the numpy module if any value is a NumPy array, else None"""
+    np = sys.modules.get("numpy")
+    if np is not None and any(isinstance(value, np.ndarray) for value in values):
+        return np
+    return None
+
 # If/Else statements
 def check_grade(score):
     """Check grade based on score"""
@@ -15,81 +34,148 @@ def check_grade(score):
     else:
         return "F"
 
-# Test the function
-scores = [95, 85, 75, 65, 55]
-print("Grade checking:")
-for score in scores:
-    grade = check_grade(score)
-    print(f"Score {score}: Grade {grade}")
-
-# For loops
-print("\nFor loop examples:")
-
-# Loop through a list
-fruits = ["apple", "banana", "orange", "grape"]
-print("Fruits:")
-for fruit in fruits:
-    print(f"  - {fruit}")
-
-# Loop with range
-print("\nNumbers 1 to 5:")
-for i in range(1, 6):
-    print(f"  {i}")
-
-# Loop with enumerate (get index and value)
-print("\nFruits with index:")
-for index, fruit in enumerate(fruits):
-    print(f"  {index}: {fruit}")
-
-# While loops
-print("\nWhile loop example:")
-count = 0
-while count < 5:
-    print(f"Count: {count}")
-    count += 1
-
-# Nested loops
-print("\nNested loop example (multiplication table):")
-for i in range(1, 4):
-    for j in range(1, 4):
-        result = i * j
-        print(f"{i} x {j} = {result}")
-
-# Break and continue
-print("\nBreak and continue examples:")
+# Table-driven grading with binary search
+class GradeTable:
+    """
+    Map scores to letter grades using sorted boundaries and bisect.
+    
+    boundaries are the lowest scores of each grade above the first one,
+    in increasing order; letters has one more entry than boundaries. The
+    default table gives the same grades as check_grade(), including the
+    lowest grade for a NaN score.
+    """
+    
+    def __init__(self, boundaries=(60, 70, 80, 90), letters=("F", "D", "C", "B", "A")):
+        boundaries = tuple(boundaries)
+        letters = tuple(letters)
+        if list(boundaries) != sorted(boundaries):
+            raise ValueError("boundaries must be in increasing order")
+        if len(letters) != len(boundaries) + 1:
+            raise ValueError("letters needs exactly one more entry than boundaries")
+        self.boundaries = boundaries
+        self.letters = letters
+    
+    def grade(self, score):
+        """Return the letter grade for one score"""
+        # NaN fails every comparison, so bisect would put it in the top grade
+        if score != score:
+            return self.letters[0]
+        return self.letters[bisect_right(self.boundaries, score)]
+    
+    def grade_many(self, scores):
+        """
+        Grade a list or array of scores in one pass.
+        
+        Returns (grades, histogram), where histogram maps every letter to
+        how many scores received it. NumPy arrays are graded with
+        searchsorted; other inputs use bisect through map().
+        """
+        np = _numpy_for(scores)
+        if np is not None:
+            positions = np.searchsorted(self.boundaries, scores, side="right")
+            if scores.dtype.kind == "f":
+                positions = np.where(np.isnan(scores), 0, positions)
+            grades = np.asarray(self.letters)[positions]
+            counts = np.bincount(positions.ravel(), minlength=len(self.letters))
+            return grades, dict(zip(self.letters, counts.tolist()))
+        
+        if not hasattr(scores, "__len__"):
+            scores = list(scores)
+        positions = list(map(bisect_right, repeat(self.boundaries), scores))
+        # A NaN total is a one-pass sign that some score is NaN and needs
+        # moving from the top grade to the lowest one
+        total = sum(scores)
+        if total != total:
+            positions = [0 if score != score else position
+                         for score, position in zip(scores, positions)]
+        grades = list(map(self.letters.__getitem__, positions))
+        counts = Counter(positions)
+        return grades, {letter: counts[i] for i, letter in enumerate(self.letters)}
 
-# Break example - stop when we find "orange"
-print("Searching for 'orange':")
-for fruit in fruits:
-    print(f"Checking: {fruit}")
-    if fruit == "orange":
-        print("Found orange! Stopping search.")
-        break
+# Grading examples
+def grade_examples():
+    """Grade a list of scores one at a time and as a batch"""
+    scores = [95, 85, 75, 65, 55]
+    print("Grade checking:")
+    for score in scores:
+        grade = check_grade(score)
+        print(f"Score {score}: Grade {grade}")
+    
+    # Grade the whole list at once with a GradeTable
+    grades, histogram = GradeTable().grade_many(scores)
+    print(f"Batch grades: {grades}")
+    print(f"Grade histogram: {histogram}")
 
-# Continue example - skip even numbers
-print("\nOdd numbers from 1 to 10:")
-for num in range(1, 11):
-    if num % 2 == 0:
-        continue  # Skip even numbers
-    print(f"  {num}")
-
-# List comprehensions (Pythonic way to create lists)
-print("\nList comprehensions:")
-
-# Create list of squares
-squares = [x**2 for x in range(1, 6)]
-print(f"Squares: {squares}")
-
-# Create list of even numbers
-evens = [x for x in range(1, 11) if x % 2 == 0]
-print(f"Even numbers: {evens}")
-
-# Create list from another list
-fruits_upper = [fruit.upper() for fruit in fruits]
-print(f"Fruits in uppercase: {fruits_upper}")
+# Loops and comprehensions
+def loop_examples():
+    """Demonstrate for/while loops, break/continue and list comprehensions"""
+    # For loops
+    print("\nFor loop examples:")
+    
+    # Loop through a list
+    fruits = ["apple", "banana", "orange", "grape"]
+    print("Fruits:")
+    for fruit in fruits:
+        print(f"  - {fruit}")
+    
+    # Loop with range
+    print("\nNumbers 1 to 5:")
+    for i in range(1, 6):
+        print(f"  {i}")
+    
+    # Loop with enumerate (get index and value)
+    print("\nFruits with index:")
+    for index, fruit in enumerate(fruits):
+        print(f"  {index}: {fruit}")
+    
+    # While loops
+    print("\nWhile loop example:")
+    count = 0
+    while count < 5:
+        print(f"Count: {count}")
+        count += 1
+    
+    # Nested loops
+    print("\nNested loop example (multiplication table):")
+    for i in range(1, 4):
+        for j in range(1, 4):
+            result = i * j
+            print(f"{i} x {j} = {result}")
+    
+    # Break and continue
+    print("\nBreak and continue examples:")
+    
+    # Break example - stop when we find "orange"
+    print("Searching for 'orange':")
+    for fruit in fruits:
+        print(f"Checking: {fruit}")
+        if fruit == "orange":
+            print("Found orange! Stopping search.")
+            break
+    
+    # Continue example - skip even numbers
+    print("\nOdd numbers from 1 to 10:")
+    for num in range(1, 11):
+        if num % 2 == 0:
+            continue  # Skip even numbers
+        print(f"  {num}")
+    
+    # List comprehensions (Pythonic way to create lists)
+    print("\nList comprehensions:")
+    
+    # Create list of squares
+    squares = [x**2 for x in range(1, 6)]
+    print(f"Squares: {squares}")
+    
+    # Create list of even numbers
+    evens = [x for x in range(1, 11) if x % 2 == 0]
+    print(f"Even numbers: {evens}")
+    
+    # Create list from another list
+    fruits_upper = [fruit.upper() for fruit in fruits]
+    print(f"Fruits in uppercase: {fruits_upper}")
 
 # Try/except for error handling
-print("\nError handling example:")
 def safe_divide(a, b):
     """Safely divide two numbers"""
     try:
@@ -100,10 +186,70 @@ def safe_divide(a, b):
     except TypeError:
         return "Invalid input types!"
 
-# Test the function
-print(f"10 / 2 = {safe_divide(10, 2)}")
-print(f"10 / 0 = {safe_divide(10, 0)}")
-print(f"10 / 'a' = {safe_divide(10, 'a')}")
+# Dividing whole columns with an error mask instead of exceptions
+DIVIDE_OK = 0
+DIVIDE_BY_ZERO = 1
+DIVIDE_INVALID = 2
+
+def divide_many(numerators, denominators, zero_fill=math.nan, invalid_fill=math.nan):
+    """
+    Divide two equal-length sequences or arrays element by element.
+    
+    Returns (results, codes): results holds floats, and codes holds
+    DIVIDE_OK, DIVIDE_BY_ZERO or DIVIDE_INVALID for each row. Bad rows
+    get zero_fill or invalid_fill instead of raising. Most are detected
+    by checks rather than exceptions; quotients too large for a float
+    are caught and also marked DIVIDE_INVALID. NumPy inputs must be
+    numeric; they are divided in one vectorized call and return NumPy
+    arrays. Other inputs return array('d') results and array('b') codes.
+    """
+    if len(numerators) != len(denominators):
+        raise ValueError("numerators and denominators must have the same length")
+    
+    np = _numpy_for(numerators, denominators)
+    if np is not None:
+        a = np.asarray(numerators, dtype=float)
+        b = np.asarray(denominators, dtype=float)
+        zero = b == 0
+        codes = np.where(zero, DIVIDE_BY_ZERO, DIVIDE_OK).astype(np.int8)
+        results = np.full(a.shape, zero_fill, dtype=float)
+        np.divide(a, b, out=results, where=~zero)
+        return results, codes
+    
+    results = array("d")
+    codes = array("b")
+    for a, b in zip(numerators, denominators):
+        # The exact type checks are much cheaper than the Real ABC check
+        if ((type(a) is float or type(a) is int or isinstance(a, Real))
+                and (type(b) is float or type(b) is int or isinstance(b, Real))):
+            if b == 0:
+                results.append(zero_fill)
+                codes.append(DIVIDE_BY_ZERO)
+            else:
+                try:
+                    results.append(a / b)
+                except OverflowError:
+                    # Huge ints (e.g. 10**400 / 1) have no float quotient
+                    results.append(invalid_fill)
+                    codes.append(DIVIDE_INVALID)
+                else:
+                    codes.append(DIVIDE_OK)
+        else:
+            results.append(invalid_fill)
+            codes.append(DIVIDE_INVALID)
+    return results, codes
+
+# Error handling examples
+def error_handling_examples():
+    """Divide values safely, one pair at a time and as whole lists"""
+    print("\nError handling example:")
+    print(f"10 / 2 = {safe_divide(10, 2)}")
+    print(f"10 / 0 = {safe_divide(10, 0)}")
+    print(f"10 / 'a' = {safe_divide(10, 'a')}")
+    
+    # Divide whole lists at once, with error codes in a separate mask
+    results, codes = divide_many([10, 10, 10], [2, 0, "a"], zero_fill=0.0)
+    print(f"Batch results: {list(results)}, error codes: {list(codes)}")
 
 # Match statement (Python 3.10+)
 def get_day_type(day):
@@ -116,9 +262,123 @@ def get_day_type(day):
         case _:
             return "Invalid day"
 
-# Test the function
-days = ["Monday", "Saturday", "InvalidDay"]
-print("\nDay type checking:")
-for day in days:
-    day_type = get_day_type(day)
-    print(f"{day}: {day_type}")
+# Classifying day names, dates and timestamps with lookup tables
+SECONDS_PER_DAY = 86400
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+DAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+class DayTypeClassifier:
+    """
+    Classify day names, dates and epoch timestamps as weekday or weekend.
+    
+    Day names are looked up in a table built once. Dates use
+    date.weekday(), and timestamps (seconds since 1970-01-01 UTC, shifted
+    by utc_offset seconds) use integer day arithmetic, so no strings are
+    built. Any date in holidays is labelled holiday_label instead, and
+    NaN, infinite or NaT timestamps are labelled invalid_label.
+    """
+    
+    def __init__(self, holidays=(), utc_offset=0, holiday_label="Holiday",
+                 invalid_label="Invalid day"):
+        self.utc_offset = utc_offset
+        self.holiday_label = holiday_label
+        self.invalid_label = invalid_label
+        # Weekday numbers follow date.weekday(): Monday is 0, Sunday is 6
+        self.labels = ("Weekday",) * 5 + ("Weekend",) * 2
+        self.holiday_days = {holiday.toordinal() - EPOCH_ORDINAL for holiday in holidays}
+        self.names = {}
+        for number, name in enumerate(DAY_NAMES):
+            for key in (name, name.capitalize(), name.upper(), name[:3], name[:3].capitalize()):
+                self.names[key] = self.labels[number]
+    
+    def _classify_epoch_day(self, day_number):
+        if day_number in self.holiday_days:
+            return self.holiday_label
+        # 1970-01-01 was a Thursday (weekday 3)
+        return self.labels[(day_number + 3) % 7]
+    
+    def classify(self, value):
+        """Classify one day name, date, datetime or epoch timestamp"""
+        if isinstance(value, str):
+            label = self.names.get(value)
+            if label is None:
+                label = self.names.get(value.strip().lower(), self.invalid_label)
+            return label
+        if isinstance(value, date):
+            day_number = value.toordinal() - EPOCH_ORDINAL
+            if day_number in self.holiday_days:
+                return self.holiday_label
+            return self.labels[value.weekday()]
+        if isinstance(value, float) and not math.isfinite(value):
+            return self.invalid_label
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return self._classify_epoch_day(int((value + self.utc_offset) // SECONDS_PER_DAY))
+        return self.invalid_label
+    
+    def classify_many(self, values):
+        """
+        Classify a whole column in one pass.
+        
+        NumPy numeric or datetime64 arrays are handled with vectorized
+        integer arithmetic. A list of timestamps uses the same arithmetic
+        in a single comprehension, and mixed columns fall back to
+        classify() for each value.
+        """
+        np = _numpy_for(values)
+        if np is not None and values.dtype.kind in "iufM":
+            invalid = None
+            if values.dtype.kind == "M":
+                invalid = np.isnat(values)
+                shifted = values + np.timedelta64(int(self.utc_offset), "s")
+                days = shifted.astype("datetime64[D]").astype(np.int64)
+            else:
+                if values.dtype.kind in "iu":
+                    # Unsigned arrays cannot take a negative offset under NumPy 2
+                    values = values.astype(np.int64)
+                days = np.floor_divide(values + self.utc_offset, SECONDS_PER_DAY)
+                if values.dtype.kind == "f":
+                    invalid = ~np.isfinite(values)
+                    days = np.where(invalid, 0, days)
+                days = days.astype(np.int64)
+            labels = np.asarray(self.labels, dtype=object)[(days + 3) % 7]
+            if self.holiday_days:
+                labels[np.isin(days, list(self.holiday_days))] = self.holiday_label
+            if invalid is not None:
+                labels[invalid] = self.invalid_label
+            return labels
+        
+        values = list(values)
+        # Non-finite floats fall through to classify(), which labels them invalid
+        if values and all(type(value) is int or (type(value) is float and math.isfinite(value))
+                          for value in values):
+            offset = self.utc_offset
+            labels = self.labels
+            holidays = self.holiday_days
+            holiday_label = self.holiday_label
+            return [
+                holiday_label if day in holidays else labels[(day + 3) % 7]
+                for day in [int((value + offset) // SECONDS_PER_DAY) for value in values]
+            ]
+        return [self.classify(value) for value in values]
+
+# Day type examples
+def day_type_examples():
+    """Classify day names, dates and timestamps"""
+    days = ["Monday", "Saturday", "InvalidDay"]
+    print("\nDay type checking:")
+    for day in days:
+        day_type = get_day_type(day)
+        print(f"{day}: {day_type}")
+    
+    # Classify names, dates and timestamps together with a holiday calendar
+    classifier = DayTypeClassifier(holidays=[date(2024, 12, 25)])
+    mixed_days = ["monday", date(2024, 12, 25), date(2024, 12, 28), 1_700_000_000]
+    for day, day_type in zip(mixed_days, classifier.classify_many(mixed_days)):
+        print(f"{day}: {day_type}")
+
+# Main execution
+if __name__ == "__main__":
+    grade_examples()
+    loop_examples()
+    error_handling_examples()
+    day_type_examples()
@@ -0,0 +1,61 @@
+# Import-time benchmark for the basic_python package
+# Runs "python -X importtime" in fresh interpreters and reports how much
+# import work each way of using the package adds on top of a bare
+# interpreter start.
+
+import os
+import statistics
+import subprocess
+import sys
+
+EXAMPLES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASELINE = "pass"
+SCENARIOS = {
+    "package only": "import basic_python",
+    "check_grade (lazy)": "from basic_python import check_grade",
+    "all helpers (lazy)": "from basic_python import check_grade, safe_divide, get_day_type, PI",
+    "control_structures": "import basic_python.control_structures",
+    "variables module": "import basic_python.variables_and_data_types",
+}
+
+def import_times(statement):
+    """Run statement under -X importtime and return [(depth, module, cumulative us)]"""
+    env = dict(os.environ, PYTHONPATH=EXAMPLES_DIR)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    if completed.stdout:
+        raise RuntimeError(f"{statement!r} printed output on import: {completed.stdout!r}")
+    entries = []
+    for line in completed.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        depth = (len(module) - len(module.lstrip()) - 1) // 2
+        entries.append((depth, module.strip(), int(cumulative)))
+    return entries
+
+def total_import_time(statement):
+    """Sum the cumulative time of every top-level import in one run"""
+    return sum(cumulative for depth, _, cumulative in import_times(statement) if depth == 0)
+
+def benchmark_imports(repeat=15):
+    """Print the median extra import time of each scenario over a bare interpreter"""
+    # Warm the bytecode cache so every scenario measures a normal, cached import
+    for statement in SCENARIOS.values():
+        import_times(statement)
+    baseline = statistics.median(total_import_time(BASELINE) for _ in range(repeat))
+    
+    print(f"{'scenario':<22} {'extra ms':>9} {'modules':>8}")
+    for label, statement in SCENARIOS.items():
+        extra = statistics.median(total_import_time(statement) - baseline
+                                  for _ in range(repeat))
+        modules = sum(1 for _, module, _ in import_times(statement)
+                      if module.startswith("basic_python"))
+        print(f"{label:<22} {extra / 1000:>9.3f} {modules:>8}")
+
+if __name__ == "__main__":
+    benchmark_imports()
@@ -0,0 +1,220 @@
+# Benchmark Suite for the IT-140 Examples
+# Times the hot functions of every example module at several input sizes,
+# stores the results as a JSON baseline and flags regressions against it.
+#
+# Usage:
+#   python benchmark_suite.py --save baseline.json
+#   python benchmark_suite.py --compare baseline.json --threshold 0.10
+#   python benchmark_suite.py --only factorial sum_all --quick
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+EXAMPLES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in ("file_operations", "functions_and_modules", "data_structures"):
+    sys.path.insert(0, os.path.join(EXAMPLES_DIR, folder))
+sys.path.insert(0, EXAMPLES_DIR)
+
+import file_handling
+import functions
+import lists_and_dictionaries
+from basic_python.control_structures import check_grade
+
+# Registry of benchmark name -> (setup function, input sizes)
+BENCHMARKS = {}
+
+def benchmark(name, sizes):
+    """Register a setup function that yields the callable to time for one size"""
+    def register(setup):
+        BENCHMARKS[name] = (contextlib.contextmanager(setup), sizes)
+        return setup
+    return register
+
+@contextlib.contextmanager
+def temporary_workdir():
+    """Run inside a fresh temporary directory, since the file examples use fixed names"""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            yield workdir
+        finally:
+            os.chdir(previous)
+
+def make_employees(size):
+    rng = random.Random(size)
+    departments = ["IT", "HR", "Finance", "Sales", "Support"]
+    return [{"name": f"Employee {i}", "department": rng.choice(departments),
+             "salary": rng.randrange(40_000, 120_000)} for i in range(size)]
+
+# File operation benchmarks
+@benchmark("read_file_lines", sizes=(1_000, 100_000))
+def bench_read_file_lines(size):
+    with temporary_workdir():
+        with open("sample.txt", "w") as file:
+            for i in range(size):
+                file.write(f"This is line number {i} of the sample file.\n")
+        yield file_handling.read_file_lines
+
+@benchmark("read_csv_file", sizes=(1_000, 100_000))
+def bench_read_csv_file(size):
+    with temporary_workdir():
+        with open("students.csv", "w") as file:
+            file.write("Name,Age,Grade,City\n")
+            for i in range(size):
+                file.write(f"Student {i},{18 + i % 10},{'ABCDF'[i % 5]},Boston\n")
+        yield file_handling.read_csv_file
+
+@benchmark("read_json_file", sizes=(1_000, 100_000))
+def bench_read_json_file(size):
+    with temporary_workdir():
+        with open("data.json", "w") as file:
+            json.dump({"records": [{"id": i, "name": f"Record {i}"} for i in range(size)]}, file)
+        yield lambda: file_handling.read_json_file(compact=True)
+
+@benchmark("list_directory", sizes=(100, 5_000))
+def bench_list_directory(size):
+    with temporary_workdir():
+        for i in range(size):
+            if i % 10 == 0:
+                os.mkdir(f"folder_{i}")
+            else:
+                open(f"file_{i}.txt", "w").close()
+        yield file_handling.list_directory
+
+# Function benchmarks
+@benchmark("factorial", sizes=(100, 1_000, 10_000))
+def bench_factorial(size):
+    def run():
+        # Clear the memo so every run measures the computation itself
+        functions._factorial_memo.clear()
+        functions.factorial(size)
+    yield run
+
+@benchmark("apply_operation", sizes=(1_000, 100_000))
+def bench_apply_operation(size):
+    numbers = list(range(size))
+    yield lambda: functions.apply_operation(numbers, functions.square)
+
+@benchmark("sum_all", sizes=(1_000, 100_000))
+def bench_sum_all(size):
+    numbers = [i * 0.5 for i in range(size)]
+    yield lambda: functions.sum_all(*numbers)
+
+@benchmark("check_grade", sizes=(1_000, 100_000))
+def bench_check_grade(size):
+    rng = random.Random(size)
+    scores = [rng.uniform(0, 100) for _ in range(size)]
+    yield lambda: [check_grade(score) for score in scores]
+
+# Data structure benchmarks
+@benchmark("combined_examples_aggregation", sizes=(1_000, 100_000))
+def bench_combined_aggregation(size):
+    employees = make_employees(size)
+    def run():
+        lists_and_dictionaries.employees_by_department(employees)
+        lists_and_dictionaries.salary_statistics(employees)
+    yield run
+
+# Timing and reporting
+def time_callable(func, warmup, repeat):
+    """Call func warmup times untimed, then return repeat timings in seconds"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(warmup):
+            func()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+def summarize(timings):
+    """Return the median and 95th percentile of a list of timings"""
+    if len(timings) > 1:
+        p95 = statistics.quantiles(timings, n=20, method="inclusive")[18]
+    else:
+        p95 = timings[0]
+    return {"median": statistics.median(timings), "p95": p95, "runs": len(timings)}
+
+def run_benchmarks(names=None, warmup=2, repeat=10, quick=False):
+    """Run the selected benchmarks and return {"name[size]": summary}"""
+    results = {}
+    for name, (setup, sizes) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        if quick:
+            sizes = sizes[:1]
+        for size in sizes:
+            with setup(size) as func:
+                summary = summarize(time_callable(func, warmup, repeat))
+            key = f"{name}[{size}]"
+            results[key] = summary
+            print(f"{key:<40} median {summary['median'] * 1e3:>10.3f} ms   "
+                  f"p95 {summary['p95'] * 1e3:>10.3f} ms")
+    return results
+
+def save_baseline(results, path):
+    baseline = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=2)
+    print(f"Baseline written to {path}")
+
+def compare_to_baseline(results, path, threshold=0.10):
+    """Print each benchmark's change in median time and return the regressions"""
+    with open(path) as file:
+        baseline = json.load(file)["results"]
+    regressions = []
+    print(f"\n{'benchmark':<40} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for key, summary in results.items():
+        if key not in baseline:
+            print(f"{key:<40} {'-':>12} {summary['median'] * 1e3:>12.3f}      new")
+            continue
+        before = baseline[key]["median"]
+        change = (summary["median"] - before) / before if before else 0.0
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{key:<40} {before * 1e3:>12.3f} {summary['median'] * 1e3:>12.3f} "
+              f"{change:>+7.1%}{flag}")
+        if change > threshold:
+            regressions.append(key)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the IT-140 example modules")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS),
+                        help="run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=10, help="timed runs per size")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed runs per size")
+    parser.add_argument("--quick", action="store_true", help="run only the smallest size")
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare results with a baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="slowdown ratio counted as a regression (default 0.10)")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmarks(args.only, args.warmup, args.repeat, args.quick)
+    if args.save:
+        save_baseline(results, args.save)
+    if args.compare:
+        regressions = compare_to_baseline(results, args.compare, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+            return 1
+        print("\nNo regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
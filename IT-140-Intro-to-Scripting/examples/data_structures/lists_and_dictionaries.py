@@ -1,6 +1,13 @@
 # Lists and Dictionaries in Python
 # This script demonstrates working with lists and dictionaries
 
+import heapq
+import math
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+from operator import itemgetter
+
 # Lists - ordered, mutable collections
 def list_examples():
     """Demonstrate list operations"""
@@ -119,6 +126,174 @@ def dictionary_examples():
     print(f"\nNested dictionary:")
     for student_id, info in students.items():
         print(f"{student_id}: {info['name']} - Grade: {info['grade']}")
+    
+    # Inverted indexes answer lookups without looping over every student
+    store = IndexedRecordStore(index_on=["grade"], multi_valued=["subjects"])
+    store.insert_many(students.items())
+    print(f"Grade A students: {sorted(store.find(grade='A'))}")
+    print(f"Grade A students taking Math: {sorted(store.find(grade='A', subjects='Math'))}")
+    store.update("student2", grade="A", subjects=["Math", "History"])
+    print(f"After Bob's update: {sorted(store.find(grade='A', subjects='Math'))}")
+
+# Keyed records with inverted indexes
+class IndexedRecordStore:
+    """
+    Store records by key and keep inverted indexes on chosen fields.
+    
+    Each index maps a field value to the set of keys that have it. For
+    fields listed in multi_valued, such as a list of subjects, every
+    element is indexed separately; a string or other single value counts
+    as a one-item list. Indexes are updated on insert, update
+    and delete, and find() intersects them starting from the smallest.
+    """
+    
+    def __init__(self, index_on=(), multi_valued=()):
+        self.multi_valued = set(multi_valued)
+        self._records = {}
+        self._indexes = {field: {} for field in (*index_on, *multi_valued)}
+    
+    def __len__(self):
+        return len(self._records)
+    
+    def __contains__(self, key):
+        return key in self._records
+    
+    def get(self, key, default=None):
+        """Return a copy of a record, so changing it cannot break the indexes"""
+        record = self._records.get(key)
+        return default if record is None else self._copy(record)
+    
+    def _copy(self, record):
+        record = dict(record)
+        for field in self.multi_valued & record.keys():
+            record[field] = list(record[field])
+        return record
+    
+    def _index_values(self, field, record):
+        if field not in record:
+            return set()
+        value = record[field]
+        return set(value) if field in self.multi_valued else {value}
+    
+    def _as_multi_value(self, value):
+        """Copy a multi-valued field as a list, wrapping a string or single value"""
+        if isinstance(value, (str, bytes)):
+            return [value]
+        try:
+            return list(value)
+        except TypeError:
+            return [value]
+    
+    def _add_to_indexes(self, key, record):
+        # Collect (and hash) every index value first so an unhashable one
+        # raises before any index has been changed
+        entries = [(index, self._index_values(field, record))
+                   for field, index in self._indexes.items()]
+        for index, values in entries:
+            for value in values:
+                index.setdefault(value, set()).add(key)
+    
+    def _remove_from_indexes(self, key, record):
+        for field, index in self._indexes.items():
+            for value in self._index_values(field, record):
+                keys = index[value]
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+    
+    def insert(self, key, record):
+        """Add a new record; a copy is stored so outside changes cannot break the indexes"""
+        if key in self._records:
+            raise KeyError(f"Record {key!r} already exists")
+        record = dict(record)
+        for field in self.multi_valued & record.keys():
+            record[field] = self._as_multi_value(record[field])
+        self._add_to_indexes(key, record)
+        self._records[key] = record
+    
+    def insert_many(self, items):
+        for key, record in items:
+            self.insert(key, record)
+    
+    def update(self, key, **changes):
+        """Change fields of a record, updating only the index entries that differ"""
+        record = self._records[key]
+        for field in self.multi_valued & changes.keys():
+            changes[field] = self._as_multi_value(changes[field])
+        diffs = [(index, self._index_values(field, record), self._index_values(field, changes))
+                 for field, index in self._indexes.items() if field in changes]
+        for index, old_values, new_values in diffs:
+            for value in old_values - new_values:
+                index[value].discard(key)
+                if not index[value]:
+                    del index[value]
+            for value in new_values - old_values:
+                index.setdefault(value, set()).add(key)
+        record.update(changes)
+    
+    def delete(self, key):
+        record = self._records[key]
+        self._remove_from_indexes(key, record)
+        del self._records[key]
+        return record
+    
+    def lookup(self, field, value):
+        """Return the set of keys whose field has value (or contains it)"""
+        return set(self._indexes[field].get(value, ()))
+    
+    def find(self, **criteria):
+        """
+        Return the set of keys matching every field=value criterion.
+        
+        For a multi-valued field the value can be one item or a list of
+        items that must all be present. Indexed fields are intersected
+        smallest set first; other fields are checked on the remaining
+        records only.
+        """
+        candidate_sets = []
+        unindexed = {}
+        for field, value in criteria.items():
+            if field not in self._indexes:
+                unindexed[field] = value
+            elif field in self.multi_valued and isinstance(value, (list, tuple, set)):
+                candidate_sets.extend(self._indexes[field].get(item, set()) for item in value)
+            else:
+                candidate_sets.append(self._indexes[field].get(value, set()))
+        
+        if candidate_sets:
+            candidate_sets.sort(key=len)
+            keys = set(candidate_sets[0]).intersection(*candidate_sets[1:])
+        else:
+            keys = set(self._records)
+        if unindexed:
+            keys = {key for key in keys
+                    if all(self._records[key].get(field) == value
+                           for field, value in unindexed.items())}
+        return keys
+    
+    def select(self, **criteria):
+        """Return {key: copy of record} for the records matching find(**criteria)"""
+        return {key: self._copy(self._records[key]) for key in self.find(**criteria)}
+
+# Grouping a list of dictionaries by one key
+def employees_by_department(employees):
+    """Build a dictionary of department -> employee names"""
+    department_employees = {}
+    for emp in employees:
+        dept = emp["department"]
+        if dept not in department_employees:
+            department_employees[dept] = []
+        department_employees[dept].append(emp["name"])
+    return department_employees
+
+# Calculating statistics from a list of dictionaries
+def salary_statistics(employees):
+    """Return the average, maximum and minimum salary"""
+    salaries = [emp["salary"] for emp in employees]
+    avg_salary = sum(salaries) / len(salaries)
+    max_salary = max(salaries)
+    min_salary = min(salaries)
+    return avg_salary, max_salary, min_salary
 
 # Working with both lists and dictionaries
 def combined_examples():
@@ -142,36 +317,438 @@ def combined_examples():
     print(f"\nIT employees: {[emp['name'] for emp in it_employees]}")
     
     # Sorting
-    employees_by_salary = sorted(employees, key=lambda x: x["salary"], reverse=True)
+    employees_by_salary = sorted(employees, key=itemgetter("salary"), reverse=True)
     print(f"\nEmployees by salary (highest first):")
     for emp in employees_by_salary:
         print(f"  {emp['name']}: ${emp['salary']}")
     
     # Dictionary with list values
-    department_employees = {}
-    for emp in employees:
-        dept = emp["department"]
-        if dept not in department_employees:
-            department_employees[dept] = []
-        department_employees[dept].append(emp["name"])
+    department_employees = employees_by_department(employees)
     
     print(f"\nEmployees by department:")
     for dept, names in department_employees.items():
         print(f"  {dept}: {names}")
     
     # Calculating statistics
-    salaries = [emp["salary"] for emp in employees]
-    avg_salary = sum(salaries) / len(salaries)
-    max_salary = max(salaries)
-    min_salary = min(salaries)
+    avg_salary, max_salary, min_salary = salary_statistics(employees)
     
     print(f"\nSalary statistics:")
     print(f"  Average: ${avg_salary:.2f}")
     print(f"  Maximum: ${max_salary}")
     print(f"  Minimum: ${min_salary}")
 
+# Column-oriented table with hash indexes
+class RecordTable:
+    """
+    Store records column by column with optional hash indexes.
+    
+    Each column is one list, or a compact array.array for columns given a
+    typecode in column_types (for example {"salary": "q"}). Indexed
+    columns keep a dict from value to row ids, so filters and group-bys on
+    them do not scan the whole table.
+    """
+    
+    def __init__(self, columns, index_on=(), column_types=None):
+        column_types = column_types or {}
+        self.columns = tuple(columns)
+        self._data = {
+            name: array(column_types[name]) if name in column_types else []
+            for name in self.columns
+        }
+        self._indexes = {}
+        self._size = 0
+        for key in index_on:
+            self.add_index(key)
+    
+    def __len__(self):
+        return self._size
+    
+    def append(self, record):
+        """Add one record given as a dict with a value for every column"""
+        row_id = self._size
+        # Convert every value and check every index key before changing
+        # anything, so a rejected record (wrong type, out of range for an
+        # array typecode, unhashable key) leaves the table as it was
+        staged = []
+        for name in self.columns:
+            column = self._data[name]
+            value = record[name]
+            if isinstance(column, array):
+                value = array(column.typecode, (value,))
+            staged.append((column, value))
+        index_keys = [(index, record[key]) for key, index in self._indexes.items()]
+        for _, value in index_keys:
+            hash(value)
+        
+        for column, value in staged:
+            if isinstance(column, array):
+                column.extend(value)
+            else:
+                column.append(value)
+        for index, value in index_keys:
+            index.setdefault(value, []).append(row_id)
+        self._size += 1
+    
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+    
+    def add_index(self, key):
+        """Build a hash index on a column and keep it updated on append"""
+        if key not in self._data:
+            raise KeyError(key)
+        index = {}
+        for row_id, value in enumerate(self._data[key]):
+            index.setdefault(value, []).append(row_id)
+        self._indexes[key] = index
+    
+    def row(self, row_id):
+        return {name: self._data[name][row_id] for name in self.columns}
+    
+    def rows(self, row_ids=None):
+        if row_ids is None:
+            row_ids = range(self._size)
+        return [self.row(row_id) for row_id in row_ids]
+    
+    def column(self, name, row_ids=None):
+        """Return a column's values, optionally only for some rows"""
+        values = self._data[name]
+        if row_ids is None:
+            return values
+        return [values[row_id] for row_id in row_ids]
+    
+    def where(self, key, value):
+        """Return the ids of rows where key == value, using an index if there is one"""
+        if key in self._indexes:
+            return list(self._indexes[key].get(value, ()))
+        return [row_id for row_id, item in enumerate(self._data[key]) if item == value]
+    
+    def select(self, key, value):
+        return self.rows(self.where(key, value))
+    
+    def aggregate(self, column, row_ids=None):
+        """Return count, sum, min, max and mean of a numeric column"""
+        return _summarize(self.column(column, row_ids))
+    
+    def group_by(self, key, column=None):
+        """
+        Group rows by key, returning {group: row ids} or, with column,
+        {group: aggregates of that column}.
+        
+        An indexed key uses its index directly. Aggregates are built in
+        one pass that updates each group's count, sum, min and max together.
+        """
+        if key in self._indexes:
+            groups = self._indexes[key]
+            if column is None:
+                return {group: list(row_ids) for group, row_ids in groups.items()}
+            values = self._data[column]
+            return _summarize_groups(
+                (group, values[row_id]) for group, row_ids in groups.items() for row_id in row_ids
+            )
+        
+        if column is None:
+            groups = {}
+            for row_id, group in enumerate(self._data[key]):
+                groups.setdefault(group, []).append(row_id)
+            return groups
+        return _summarize_groups(zip(self._data[key], self._data[column]))
+
+def _summarize_groups(pairs):
+    """Aggregate (group, value) pairs into per-group count, sum, min, max and mean"""
+    totals = {}
+    for group, value in pairs:
+        entry = totals.get(group)
+        if entry is None:
+            totals[group] = [1, value, value, value]
+        else:
+            entry[0] += 1
+            entry[1] += value
+            if value < entry[2]:
+                entry[2] = value
+            if value > entry[3]:
+                entry[3] = value
+    return {
+        group: {"count": count, "sum": total, "min": low, "max": high,
+                "mean": total / count}
+        for group, (count, total, low, high) in totals.items()
+    }
+
+def _summarize(values):
+    """Aggregate a column in one pass"""
+    summary = _summarize_groups((None, value) for value in values)
+    return summary.get(None, {"count": 0, "sum": 0, "min": None, "max": None, "mean": None})
+
+# Top-k queries and incrementally sorted views
+def top_k(records, k, field):
+    """Return the k records with the largest field value using a heap"""
+    return heapq.nlargest(k, records, key=itemgetter(field))
+
+class SortedView:
+    """
+    Keep records sorted by one field as they are added, removed or updated.
+    
+    Records live in a list of small sorted buckets, so an insert or a
+    delete is a binary search plus a short list shift instead of a full
+    re-sort. top(k) reads the largest k records straight from the end.
+    Records are tracked by identity, so remove() and update() expect the
+    same dict objects that were added.
+    """
+    
+    BUCKET_SIZE = 1000
+    
+    def __init__(self, field, records=()):
+        self.field = field
+        self._key = itemgetter(field)
+        self._order = count()
+        self._entries = {}
+        entries = []
+        for record in records:
+            entry = (self._key(record), next(self._order), record)
+            self._entries[id(record)] = entry
+            entries.append(entry)
+        entries.sort(key=itemgetter(0, 1))
+        self._buckets = [entries[i:i + self.BUCKET_SIZE]
+                         for i in range(0, len(entries), self.BUCKET_SIZE)]
+        self._maxes = [bucket[-1][:2] for bucket in self._buckets]
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __iter__(self):
+        for bucket in self._buckets:
+            for entry in bucket:
+                yield entry[2]
+    
+    def add(self, record):
+        entry = (self._key(record), next(self._order), record)
+        self._entries[id(record)] = entry
+        if not self._buckets:
+            self._buckets.append([entry])
+            self._maxes.append(entry[:2])
+            return
+        position = min(bisect_left(self._maxes, entry[:2]), len(self._buckets) - 1)
+        bucket = self._buckets[position]
+        insort(bucket, entry, key=itemgetter(0, 1))
+        self._maxes[position] = bucket[-1][:2]
+        if len(bucket) > 2 * self.BUCKET_SIZE:
+            self._buckets[position:position + 1] = [bucket[:self.BUCKET_SIZE],
+                                                    bucket[self.BUCKET_SIZE:]]
+            self._maxes[position:position + 1] = [bucket[self.BUCKET_SIZE - 1][:2],
+                                                  bucket[-1][:2]]
+    
+    def remove(self, record):
+        entry = self._entries.pop(id(record))
+        position = bisect_left(self._maxes, entry[:2])
+        bucket = self._buckets[position]
+        index = bisect_left(bucket, entry[:2], key=itemgetter(0, 1))
+        del bucket[index]
+        if bucket:
+            self._maxes[position] = bucket[-1][:2]
+        else:
+            del self._buckets[position]
+            del self._maxes[position]
+    
+    def update(self, record, **changes):
+        """Change fields of a record and move it to its new sorted position"""
+        self.remove(record)
+        record.update(changes)
+        self.add(record)
+    
+    def top(self, k):
+        """Return the k records with the largest field value, largest first"""
+        result = []
+        for bucket in reversed(self._buckets):
+            for entry in reversed(bucket):
+                if len(result) == k:
+                    return result
+                result.append(entry[2])
+        return result
+    
+    def between(self, low, high):
+        """Return records whose field value is in [low, high], in order"""
+        start = bisect_left(self._maxes, (low,))
+        result = []
+        for bucket in self._buckets[start:]:
+            if bucket[0][0] > high:
+                break
+            keys = [entry[0] for entry in bucket]
+            for entry in bucket[bisect_left(keys, low):bisect_right(keys, high)]:
+                result.append(entry[2])
+        return result
+
+# One-pass statistics over a stream of numbers
+class StreamingStats:
+    """
+    Accumulate count, mean, variance, min, max and quantiles in one pass.
+    
+    The mean and variance use Welford's update, so no values are stored.
+    Quantiles are approximated with a small t-digest: values are grouped
+    into weighted centroids, which stay finer near the tails, so memory
+    is bounded by the compression setting. Two accumulators can be
+    combined with merge(), for example to join partial results from
+    several processes (instances are picklable).
+    """
+    
+    def __init__(self, values=(), compression=100):
+        self.compression = compression
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+        self._centroids = []
+        self._buffer = []
+        self.update_many(values)
+    
+    def update(self, value):
+        """Add one value"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self._buffer.append(value)
+        if len(self._buffer) >= 10 * self.compression:
+            self._compress()
+    
+    def update_many(self, values):
+        for value in values:
+            self.update(value)
+        return self
+    
+    @property
+    def variance(self):
+        """Sample variance (n - 1 in the denominator)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+    
+    def _compress(self):
+        """Fold buffered values into centroids, merging neighbours within the size limit"""
+        points = sorted(self._centroids + [[value, 1] for value in self._buffer])
+        self._buffer = []
+        if not points:
+            return
+        total = sum(weight for _, weight in points)
+        merged = []
+        cumulative = 0
+        mean, weight = points[0]
+        for next_mean, next_weight in points[1:]:
+            q = (cumulative + weight + next_weight / 2) / total
+            limit = max(1.0, 4 * total * q * (1 - q) / self.compression)
+            if weight + next_weight <= limit:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                merged.append([mean, weight])
+                cumulative += weight
+                mean, weight = next_mean, next_weight
+        merged.append([mean, weight])
+        self._centroids = merged
+    
+    def quantile(self, q):
+        """Return an approximate q-quantile (0 <= q <= 1)"""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+        self._compress()
+        centroids = self._centroids
+        target = q * self.count
+        # Interpolate between centroid centres, using min and max at the ends
+        previous_position, previous_value = 0, self.min
+        cumulative = 0
+        for mean, weight in centroids:
+            position = cumulative + weight / 2
+            if target < position:
+                span = position - previous_position
+                fraction = (target - previous_position) / span if span else 0
+                return previous_value + fraction * (mean - previous_value)
+            previous_position, previous_value = position, mean
+            cumulative += weight
+        span = self.count - previous_position
+        fraction = (target - previous_position) / span if span else 0
+        return previous_value + fraction * (self.max - previous_value)
+    
+    def merge(self, other):
+        """Return a new accumulator combining this one and other"""
+        combined = StreamingStats(compression=max(self.compression, other.compression))
+        combined.count = self.count + other.count
+        if combined.count:
+            delta = other.mean - self.mean
+            combined.mean = self.mean + delta * other.count / combined.count
+            combined._m2 = (self._m2 + other._m2
+                            + delta * delta * self.count * other.count / combined.count)
+        mins = [value for value in (self.min, other.min) if value is not None]
+        maxes = [value for value in (self.max, other.max) if value is not None]
+        combined.min = min(mins) if mins else None
+        combined.max = max(maxes) if maxes else None
+        combined._centroids = [list(c) for c in self._centroids + other._centroids]
+        combined._buffer = self._buffer + other._buffer
+        combined._compress()
+        return combined
+    
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "min": self.min,
+            "max": self.max,
+            "median": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+        }
+
+def table_examples():
+    """Demonstrate filtering and grouping with an indexed RecordTable"""
+    print("\n=== RECORD TABLE EXAMPLES ===\n")
+    
+    employees = RecordTable(["name", "department", "salary"],
+                            index_on=["department"], column_types={"salary": "q"})
+    employees.extend([
+        {"name": "Alice", "department": "IT", "salary": 60000},
+        {"name": "Bob", "department": "HR", "salary": 55000},
+        {"name": "Charlie", "department": "IT", "salary": 65000},
+        {"name": "Diana", "department": "Finance", "salary": 58000}
+    ])
+    
+    # Filtering uses the department index instead of scanning every row
+    it_rows = employees.where("department", "IT")
+    print(f"IT employees: {employees.column('name', it_rows)}")
+    
+    # Group-by with aggregates
+    print("Salary by department:")
+    for dept, stats in employees.group_by("department", "salary").items():
+        print(f"  {dept}: count={stats['count']}, mean=${stats['mean']:.2f}, "
+              f"min=${stats['min']}, max=${stats['max']}")
+    
+    stats = employees.aggregate("salary")
+    print(f"All salaries: average ${stats['mean']:.2f}, "
+          f"max ${stats['max']}, min ${stats['min']}")
+    
+    # Top earners without re-sorting after every update
+    records = employees.rows()
+    print(f"Top 2 earners (heap): {[emp['name'] for emp in top_k(records, 2, 'salary')]}")
+    by_salary = SortedView("salary", records)
+    by_salary.update(records[1], salary=70000)
+    print(f"Top 2 after Bob's raise: {[emp['name'] for emp in by_salary.top(2)]}")
+    
+    # Statistics in one pass over a salary stream, merged from two halves
+    first_half = StreamingStats(emp["salary"] for emp in records[:2])
+    second_half = StreamingStats(emp["salary"] for emp in records[2:])
+    stats = first_half.merge(second_half)
+    print(f"Streaming salary stats: mean=${stats.mean:.2f}, stdev=${stats.stdev:.2f}, "
+          f"median=${stats.quantile(0.5):.2f}")
+
 # Main execution
 if __name__ == "__main__":
     list_examples()
     dictionary_examples()
     combined_examples()
+    table_examples()
@@ -2,8 +2,23 @@
 # This script demonstrates reading from and writing to files
 
 import os
+import io
 import json
 import csv
+import hashlib
+import mmap
+import re
+import shutil
+import stat
+import tempfile
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from fnmatch import translate
+from itertools import chain, islice
 
 # Writing to a text file
 def write_text_file():
@@ -19,31 +34,164 @@ We can write various types of content here.
     print(f"Content written to {filename}")
 
 # Reading from a text file
-def read_text_file():
-    """Read content from a text file"""
+def read_text_file(cached=False):
+    """Read content from a text file (cached=True goes through read_cache)"""
     filename = "sample.txt"
     
     try:
-        with open(filename, 'r') as file:
-            content = file.read()
+        if cached:
+            content = read_cache.read_text(filename)
+        else:
+            with open(filename, 'r') as file:
+                content = file.read()
         print(f"Content from {filename}:")
         print(content)
     except FileNotFoundError:
         print(f"File {filename} not found!")
 
+# Reading a file through a memory map
+class MappedTextFile:
+    """
+    Expose a text file as a zero-copy, read-only buffer backed by mmap.
+    
+    Searching and decoding read straight from the mapping, and only the
+    ranges passed to decode() are turned into str. Slicing returns a
+    bytes copy of just that range, so slices stay valid after close().
+    """
+    
+    def __init__(self, filename, encoding="utf-8"):
+        self.filename = filename
+        self.encoding = encoding
+        self._file = open(filename, 'rb')
+        self._map = None
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+        else:
+            # mmap cannot map an empty file, so use an empty buffer instead
+            self._view = memoryview(b"")
+    
+    def __len__(self):
+        return len(self._view)
+    
+    def __getitem__(self, index):
+        """Return a bytes copy of a slice (or a single byte value)"""
+        if isinstance(index, slice):
+            return self._view[index].tobytes()
+        return self._view[index]
+    
+    def find(self, pattern, start=0, end=None):
+        """Return the byte offset of pattern, or -1 if it is not found"""
+        if isinstance(pattern, str):
+            pattern = pattern.encode(self.encoding)
+        if self._map is None:
+            return -1
+        if end is None:
+            end = len(self._map)
+        return self._map.find(pattern, start, end)
+    
+    def line_bounds(self, start=0):
+        """Yield (start, end) byte offsets of each line, excluding the newline"""
+        size = len(self)
+        while start < size:
+            newline = self.find(b"\n", start)
+            if newline == -1:
+                yield start, size
+                return
+            end = newline
+            if end > start and self._view[end - 1] == ord("\r"):
+                end -= 1
+            yield start, end
+            start = newline + 1
+    
+    def decode(self, start=0, end=None):
+        """Decode only the requested byte range into a string"""
+        if end is None:
+            end = len(self)
+        return str(self._view[start:end], self.encoding)
+    
+    def lines(self):
+        """Yield each line decoded, one at a time"""
+        for start, end in self.line_bounds():
+            yield self.decode(start, end)
+    
+    def close(self):
+        """Release the buffer, the mapping and the file handle"""
+        try:
+            self._view.release()
+            if self._map is not None:
+                self._map.close()
+        finally:
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def read_text_file_mapped():
+    """Read content from a text file through a memory map"""
+    filename = "sample.txt"
+    
+    try:
+        with MappedTextFile(filename) as mapped:
+            print(f"Content from {filename} ({len(mapped)} bytes, memory mapped):")
+            for line in mapped.lines():
+                print(line)
+    except FileNotFoundError:
+        print(f"File {filename} not found!")
+
 # Reading file line by line
 def read_file_lines():
     """Read file line by line"""
     filename = "sample.txt"
     
     try:
-        with open(filename, 'r') as file:
-            lines = file.readlines()
-        print(f"Lines from {filename}:")
-        for i, line in enumerate(lines, 1):
-            print(f"Line {i}: {line.strip()}")
+        # Fetch the first line before printing, so a missing file is reported first
+        lines = stream_file_lines(filename)
+        first = next(lines, None)
     except FileNotFoundError:
         print(f"File {filename} not found!")
+        return
+    
+    print(f"Lines from {filename}:")
+    if first is not None:
+        for i, line, _ in chain([first], lines):
+            print(f"Line {i}: {line.strip()}")
+
+# Streaming a large file without loading it into memory
+def stream_file_lines(filename="sample.txt", buffer_size=64 * 1024,
+                      start_line=1, byte_offset=None, encoding="utf-8"):
+    """
+    Lazily yield (line_number, line, next_offset) for each line in a file.
+    
+    Only one buffered chunk is held at a time, so memory stays flat no
+    matter how large the file is. The line ending is stripped and a last
+    line without a trailing newline is still returned.
+    
+    To resume an earlier run, pass the last next_offset seen as
+    byte_offset and the following line number as start_line. Without a
+    byte_offset, the lines before start_line are skipped.
+    """
+    if buffer_size < 2:
+        raise ValueError("buffer_size must be at least 2 bytes")
+    if start_line < 1:
+        raise ValueError("start_line must be at least 1")
+    
+    with open(filename, 'rb', buffering=buffer_size) as file:
+        offset = 0
+        line_number = 1
+        if byte_offset is not None:
+            file.seek(byte_offset)
+            offset = byte_offset
+            line_number = start_line
+        
+        for raw in file:
+            offset += len(raw)
+            if line_number >= start_line:
+                yield line_number, raw.rstrip(b"\r\n").decode(encoding), offset
+            line_number += 1
 
 # Appending to a file
 def append_to_file():
@@ -55,9 +203,172 @@ def append_to_file():
         file.write(additional_content)
     print(f"Content appended to {filename}")
 
+# Appending many records through one open handle
+class _AppendBuffer:
+    """
+    Buffered records and the open file behind a BufferedAppender.
+    
+    The timer thread and the appender's finalizer only hold this object,
+    never the appender, so an appender that is dropped without close()
+    can still be garbage collected and have its records flushed.
+    """
+    
+    def __init__(self, file, buffer_size, flush_interval, durability):
+        self.file = file
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.durability = durability
+        self.buffer = []
+        self.pending = 0
+        self.oldest = None
+        self.closing = False
+        self.condition = threading.Condition()
+        self.timer = None
+    
+    def write(self, text):
+        with self.condition:
+            if self.closing:
+                raise ValueError("write to a closed BufferedAppender")
+            if not self.buffer:
+                self.oldest = time.monotonic()
+                self.condition.notify()
+            self.buffer.append(text)
+            self.pending += len(text)
+            if self.pending >= self.buffer_size:
+                self.flush_locked()
+    
+    def flush_periodically(self):
+        """Background loop that flushes records older than flush_interval"""
+        with self.condition:
+            while not self.closing:
+                if not self.buffer:
+                    self.condition.wait()
+                    continue
+                remaining = self.oldest + self.flush_interval - time.monotonic()
+                if remaining > 0:
+                    self.condition.wait(remaining)
+                else:
+                    self.flush_locked()
+    
+    def flush_locked(self):
+        if self.buffer:
+            self.file.write("".join(self.buffer))
+            self.buffer.clear()
+            self.pending = 0
+            self.oldest = None
+        self.file.flush()
+        if self.durability == "batch":
+            os.fsync(self.file.fileno())
+    
+    def flush(self):
+        with self.condition:
+            self.flush_locked()
+    
+    def close(self):
+        """Stop the timer, flush what is left and close the file"""
+        with self.condition:
+            if self.closing:
+                return
+            self.closing = True
+            self.condition.notify()
+        if self.timer is not None:
+            self.timer.join()
+        self.flush_locked()
+        if self.durability == "close":
+            os.fsync(self.file.fileno())
+        self.file.close()
+
+class BufferedAppender:
+    """
+    Keep a file open for appending and write records in batches.
+    
+    Records are buffered in memory and written when the buffer reaches
+    buffer_size characters, or by a background thread once the oldest
+    buffered record has waited flush_interval seconds (None turns the
+    timer off). durability controls when data is forced to disk:
+    "none" never calls fsync, "batch" calls it after every flush and
+    "close" calls it once when the appender is closed. An appender that
+    is garbage collected or still open at interpreter exit is closed
+    then, so buffered records are not lost.
+    """
+    
+    DURABILITY_MODES = ("none", "batch", "close")
+    
+    def __init__(self, filename, buffer_size=64 * 1024, flush_interval=1.0,
+                 durability="none", encoding="utf-8"):
+        if durability not in self.DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {self.DURABILITY_MODES}")
+        self.filename = filename
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.durability = durability
+        self._state = _AppendBuffer(open(filename, 'a', encoding=encoding),
+                                    buffer_size, flush_interval, durability)
+        if flush_interval is not None:
+            self._state.timer = threading.Thread(target=self._state.flush_periodically,
+                                                 daemon=True)
+            self._state.timer.start()
+        self._finalizer = weakref.finalize(self, self._state.close)
+    
+    def write(self, text):
+        """Add text to the buffer, flushing if the size limit is hit"""
+        self._state.write(text)
+    
+    def flush(self):
+        """Write all buffered records to the file as one batch"""
+        self._state.flush()
+    
+    def close(self):
+        """Stop the timer, flush what is left and close the file"""
+        self._finalizer()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def append_with_appender():
+    """Append several lines to a file using one buffered handle"""
+    filename = "sample.txt"
+    
+    with BufferedAppender(filename, durability="close") as appender:
+        for i in range(1, 4):
+            appender.write(f"\nBuffered line {i}.")
+    print(f"Buffered content appended to {filename}")
+
+def benchmark_append(records=5000):
+    """Compare one open/write/close per record with BufferedAppender"""
+    filename = "append_benchmark.txt"
+    record = "benchmark record\n"
+    
+    try:
+        start = time.perf_counter()
+        for _ in range(records):
+            with open(filename, 'a') as file:
+                file.write(record)
+        one_shot = time.perf_counter() - start
+        os.remove(filename)
+        
+        print(f"Appending {records} records:")
+        print(f"  open/write/close per record: {records / one_shot:,.0f} records/s")
+        for durability in BufferedAppender.DURABILITY_MODES:
+            start = time.perf_counter()
+            with BufferedAppender(filename, durability=durability) as appender:
+                for _ in range(records):
+                    appender.write(record)
+            elapsed = time.perf_counter() - start
+            os.remove(filename)
+            print(f"  BufferedAppender ({durability}): {records / elapsed:,.0f} records/s")
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
+
 # Working with JSON files
-def write_json_file():
-    """Write data to a JSON file"""
+JSON_COMPACT_SEPARATORS = (",", ":")
+
+def write_json_file(compact=False):
+    """Write data to a JSON file (compact=True skips indentation and spaces)"""
     data = {
         "name": "Alice",
         "age": 25,
@@ -68,21 +379,71 @@ def write_json_file():
     
     filename = "data.json"
     with open(filename, 'w') as file:
-        json.dump(data, file, indent=4)
+        if compact:
+            json.dump(data, file, separators=JSON_COMPACT_SEPARATORS)
+        else:
+            json.dump(data, file, indent=4)
     print(f"JSON data written to {filename}")
 
-def read_json_file():
-    """Read data from a JSON file"""
+def read_json_file(compact=False, cached=False):
+    """Read data from a JSON file (compact=True prints it as one line of compact JSON)"""
     filename = "data.json"
     
     try:
-        with open(filename, 'r') as file:
-            data = json.load(file)
+        if cached:
+            data = read_cache.read_json(filename)
+        else:
+            with open(filename, 'r') as file:
+                data = json.load(file)
         print(f"JSON data from {filename}:")
-        print(json.dumps(data, indent=2))
+        if compact:
+            print(json.dumps(data, separators=JSON_COMPACT_SEPARATORS))
+        else:
+            print(json.dumps(data, indent=2))
     except FileNotFoundError:
         print(f"File {filename} not found!")
 
+# Working with JSON Lines files (one JSON record per line)
+def append_json_lines(filename, records):
+    """Append records to a JSON Lines file, one compact record per line"""
+    encoder = json.JSONEncoder(separators=JSON_COMPACT_SEPARATORS)
+    count = 0
+    with open(filename, 'a', encoding="utf-8") as file:
+        for record in records:
+            file.write(encoder.encode(record))
+            file.write("\n")
+            count += 1
+    return count
+
+def stream_json_lines(filename):
+    """Lazily yield one decoded record per line of a JSON Lines file"""
+    decoder = json.JSONDecoder()
+    with open(filename, 'r', encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield decoder.decode(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"{filename} line {line_number}: {error}") from error
+
+def json_lines_examples():
+    """Write and read records in JSON Lines format"""
+    filename = "records.jsonl"
+    records = [
+        {"name": "Alice", "age": 25},
+        {"name": "Bob", "age": 30},
+    ]
+    
+    count = append_json_lines(filename, records)
+    count += append_json_lines(filename, [{"name": "Charlie", "age": 35}])
+    print(f"{count} records appended to {filename}")
+    
+    print(f"Records from {filename}:")
+    for record in stream_json_lines(filename):
+        print(record)
+
 # Working with CSV files
 def write_csv_file():
     """Write data to a CSV file"""
@@ -100,55 +461,331 @@ def write_csv_file():
         writer.writerows(students)
     print(f"CSV data written to {filename}")
 
-def read_csv_file():
-    """Read data from a CSV file"""
+def read_csv_file(cached=False):
+    """Read data from a CSV file (cached=True goes through read_cache)"""
     filename = "students.csv"
     
     try:
-        with open(filename, 'r') as file:
-            reader = csv.reader(file)
+        if cached:
             print(f"CSV data from {filename}:")
-            for row in reader:
+            for row in read_cache.read_csv(filename):
                 print(row)
+        else:
+            with open(filename, 'r') as file:
+                reader = csv.reader(file)
+                print(f"CSV data from {filename}:")
+                for row in reader:
+                    print(row)
     except FileNotFoundError:
         print(f"File {filename} not found!")
 
+# Reading a large CSV file in typed chunks
+CSV_COLUMN_TYPES = {"int": int, "float": float, "str": str}
+CSV_ARRAY_TYPECODES = {int: "q", float: "d"}
+
+def _parse_csv_schema(schema):
+    """Turn {"Age": "int"} or ["Age:int"] into {"Age": int}"""
+    if not isinstance(schema, dict):
+        schema = dict(column.split(":", 1) for column in schema)
+    parsed = {}
+    for name, column_type in schema.items():
+        if isinstance(column_type, str):
+            if column_type not in CSV_COLUMN_TYPES:
+                raise ValueError(f"Unknown type {column_type!r} for column {name!r}")
+            column_type = CSV_COLUMN_TYPES[column_type]
+        parsed[name] = column_type
+    return parsed
+
+def stream_csv_file(filename, schema, chunk_size=10000, columnar=False):
+    """
+    Lazily read a CSV file with a header row in chunks of typed rows.
+    
+    schema maps column names to types, for example {"Age": int,
+    "Grade": str} or ["Age:int", "Grade:str"]. Only those columns are
+    returned, in schema order. Each chunk is converted one column at a
+    time, so every converter runs over a whole column with map().
+    
+    By default each chunk is a list of row tuples. With columnar=True it
+    is a dict of column name to values, where int and float columns are
+    packed into array.array buffers instead of lists.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    schema = _parse_csv_schema(schema)
+    
+    with open(filename, 'r', newline='') as file:
+        # csv.reader yields [] for blank lines, such as a trailing empty line
+        reader = filter(None, csv.reader(file))
+        header = next(reader, None)
+        if header is None:
+            return
+        missing = [name for name in schema if name not in header]
+        if missing:
+            raise ValueError(f"Columns not found in {filename}: {missing}")
+        positions = [header.index(name) for name in schema]
+        converters = list(schema.values())
+        
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                return
+            if set(map(len, rows)) != {len(header)}:
+                raise ValueError(f"Rows in {filename} do not all match the header width")
+            raw_columns = list(zip(*rows))
+            columns = []
+            for position, converter in zip(positions, converters):
+                values = raw_columns[position]
+                if converter is not str:
+                    values = map(converter, values)
+                if columnar and converter in CSV_ARRAY_TYPECODES:
+                    columns.append(array(CSV_ARRAY_TYPECODES[converter], values))
+                else:
+                    columns.append(list(values))
+            
+            if columnar:
+                yield dict(zip(schema, columns))
+            else:
+                yield list(zip(*columns))
+
+def read_csv_typed():
+    """Read the students CSV back with typed columns"""
+    filename = "students.csv"
+    schema = {"Name": str, "Age": int, "Grade": str}
+    
+    try:
+        print(f"Typed CSV rows from {filename}:")
+        for chunk in stream_csv_file(filename, schema, chunk_size=2):
+            for row in chunk:
+                print(row)
+        for columns in stream_csv_file(filename, schema, columnar=True):
+            print(f"Age column: {columns['Age']}")
+    except FileNotFoundError:
+        print(f"File {filename} not found!")
+
+# File metadata from a single stat call
+class FileInfo:
+    """Compact record of the metadata returned by one os.stat call"""
+    
+    __slots__ = ("path", "size", "mtime", "type", "mode")
+    
+    def __init__(self, path, size, mtime, type, mode):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.type = type
+        self.mode = mode
+    
+    @property
+    def is_file(self):
+        return self.type == "file"
+    
+    @property
+    def is_dir(self):
+        return self.type == "directory"
+    
+    def __repr__(self):
+        return (f"FileInfo(path={self.path!r}, size={self.size}, "
+                f"mtime={self.mtime}, type={self.type!r}, mode={oct(self.mode)})")
+
+def _file_type(mode):
+    """Name the file type stored in a stat mode"""
+    if stat.S_ISREG(mode):
+        return "file"
+    if stat.S_ISDIR(mode):
+        return "directory"
+    if stat.S_ISLNK(mode):
+        return "symlink"
+    return "other"
+
+def get_file_info(path, follow_symlinks=True):
+    """Return a FileInfo for path, or None if it does not exist"""
+    try:
+        st = os.stat(path, follow_symlinks=follow_symlinks)
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        # Like os.path.exists: "file.txt/x" and paths with NUL bytes do not exist
+        return None
+    return FileInfo(path, st.st_size, st.st_mtime, _file_type(st.st_mode),
+                    stat.S_IMODE(st.st_mode))
+
+def get_files_info(paths, follow_symlinks=True):
+    """Return a dict mapping each path to its FileInfo (None if missing)"""
+    return {path: get_file_info(path, follow_symlinks) for path in paths}
+
 # File and directory operations
 def file_operations():
     """Demonstrate various file operations"""
     filename = "sample.txt"
     
-    # Check if file exists
-    if os.path.exists(filename):
+    # One stat call gives existence, size, modification time and type
+    info = get_file_info(filename)
+    if info is not None:
         print(f"{filename} exists")
         
         # Get file size
-        size = os.path.getsize(filename)
-        print(f"File size: {size} bytes")
+        print(f"File size: {info.size} bytes")
         
         # Get file modification time
-        import time
-        mod_time = os.path.getmtime(filename)
-        mod_time_str = time.ctime(mod_time)
+        mod_time_str = time.ctime(info.mtime)
         print(f"Last modified: {mod_time_str}")
         
         # Check if it's a file or directory
-        if os.path.isfile(filename):
+        if info.is_file:
             print(f"{filename} is a file")
-        if os.path.isdir(filename):
+        if info.is_dir:
             print(f"{filename} is a directory")
     else:
         print(f"{filename} does not exist")
+    
+    # Metadata for several paths at once
+    for path, info in get_files_info([filename, ".", "missing.txt"]).items():
+        print(f"  {path}: {info.type if info else 'missing'}")
 
 # List directory contents
 def list_directory():
     """List contents of current directory"""
     print("Current directory contents:")
-    for item in os.listdir('.'):
-        if os.path.isfile(item):
-            print(f"  File: {item}")
-        elif os.path.isdir(item):
-            print(f"  Directory: {item}")
+    for entry in walk_directory('.', max_depth=0):
+        if entry.is_file():
+            print(f"  File: {entry.name}")
+        elif entry.is_dir():
+            print(f"  Directory: {entry.name}")
+
+# Walking a directory tree with os.scandir
+def _compile_globs(patterns):
+    """Combine glob patterns into one regex match function (or None)"""
+    if not patterns:
+        return None
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    return re.compile("|".join(translate(pattern) for pattern in patterns)).match
+
+def walk_directory(top=".", include=None, exclude=None, max_depth=None,
+                   follow_symlinks=False):
+    """
+    Lazily yield os.DirEntry objects for everything under top.
+    
+    include and exclude are glob patterns (or lists of them) matched
+    against entry names. Excluded directories are not descended into;
+    include only filters what is yielded. Entries directly inside top are
+    at depth 0, and max_depth limits how deep the walk goes. The file
+    type cached on each DirEntry is reused, so no extra stat calls are
+    made on platforms that report it.
+    """
+    include_match = _compile_globs(include)
+    exclude_match = _compile_globs(exclude)
+    
+    # Only one directory handle is open at a time
+    pending = [(top, 0)]
+    while pending:
+        path, depth = pending.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if exclude_match and exclude_match(entry.name):
+                        continue
+                    if include_match is None or include_match(entry.name):
+                        yield entry
+                    if ((max_depth is None or depth < max_depth)
+                            and entry.is_dir(follow_symlinks=follow_symlinks)):
+                        pending.append((entry.path, depth + 1))
+        except (PermissionError, FileNotFoundError):
+            # Skip directories that vanish or cannot be read during the walk
+            if path == top:
+                raise
+
+# Scanning a large directory tree in parallel
+def _scan_one_directory(path, exclude_match):
+    """Scan one directory, returning FileInfo records and its subdirectories"""
+    records = []
+    subdirectories = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if exclude_match and exclude_match(entry.name):
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                records.append(FileInfo(entry.path, st.st_size, st.st_mtime,
+                                        _file_type(st.st_mode), stat.S_IMODE(st.st_mode)))
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+    except (PermissionError, FileNotFoundError):
+        pass
+    return records, subdirectories
+
+class ParallelDirectoryScan:
+    """
+    Walk a directory tree with os.scandir calls spread over a thread pool.
+    
+    Each subdirectory is scanned as its own task so the I/O waits overlap,
+    which matters most on network filesystems. Iterating yields FileInfo
+    records as directories finish, or in path order with sort=True. After
+    iteration, file_count, dir_count, other_count and total_size hold the
+    totals of the latest scan.
+    """
+    
+    def __init__(self, top=".", max_workers=8, include=None, exclude=None, sort=False):
+        if not os.path.isdir(top):
+            raise NotADirectoryError(f"Not a directory: {top}")
+        self.top = top
+        self.max_workers = max_workers
+        self.include = include
+        self.exclude = exclude
+        self.sort = sort
+        self._reset_totals()
+    
+    def _reset_totals(self):
+        self.file_count = 0
+        self.dir_count = 0
+        self.other_count = 0
+        self.total_size = 0
+    
+    def _scan(self):
+        # Each iteration starts a fresh scan, so count it from zero
+        self._reset_totals()
+        include_match = _compile_globs(self.include)
+        exclude_match = _compile_globs(self.exclude)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {executor.submit(_scan_one_directory, self.top, exclude_match)}
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    records, subdirectories = future.result()
+                    for path in subdirectories:
+                        running.add(executor.submit(_scan_one_directory, path, exclude_match))
+                    for info in records:
+                        if include_match and not include_match(os.path.basename(info.path)):
+                            continue
+                        if info.is_file:
+                            self.file_count += 1
+                            self.total_size += info.size
+                        elif info.is_dir:
+                            self.dir_count += 1
+                        else:
+                            self.other_count += 1
+                        yield info
+    
+    def __iter__(self):
+        if self.sort:
+            return iter(sorted(self._scan(), key=lambda info: info.path))
+        return self._scan()
+    
+    def summary(self):
+        """Return the aggregate counts and sizes collected so far"""
+        return {
+            "files": self.file_count,
+            "directories": self.dir_count,
+            "other": self.other_count,
+            "total_size": self.total_size,
+        }
+
+def scan_directory_parallel(top=".", max_workers=8, include=None, exclude=None):
+    """Scan a whole tree in parallel and return its sorted records and totals"""
+    scan = ParallelDirectoryScan(top, max_workers, include, exclude, sort=True)
+    return list(scan), scan.summary()
 
 # Create and remove directories
 def directory_operations():
@@ -179,6 +816,190 @@ def directory_operations():
     os.rmdir(dir_name)
     print(f"Removed directory: {dir_name}")
 
+# Creating and removing many files at once
+def _write_file_atomically(path, content, encoding="utf-8"):
+    """Write to a temp file next to path, then rename it into place"""
+    if isinstance(content, str):
+        content = content.encode(encoding)
+    directory, name = os.path.split(path)
+    temp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+    # Mode 0o666 lets the kernel apply the umask, giving the same
+    # permissions as open(path, "w") without touching the process umask
+    fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+def create_file_tree(root, manifest, max_workers=8, encoding="utf-8"):
+    """
+    Create many files under root from a {relative_path: content} manifest.
+    
+    Only the deepest directories are passed to os.makedirs, since that
+    creates their parents as well. Files are written by a thread pool,
+    and each one appears atomically through a temp file and a rename.
+    Returns the list of paths written.
+    """
+    root = os.path.abspath(root)
+    targets = {}
+    for relative_path, content in manifest.items():
+        path = os.path.normpath(os.path.join(root, relative_path))
+        if os.path.commonpath([root, path]) != root or path == root:
+            raise ValueError(f"Path escapes the tree root: {relative_path}")
+        targets[path] = content
+    
+    # Keep only directories that are not a parent of another one
+    directories = {os.path.dirname(path) for path in targets}
+    parents = set()
+    for directory in directories:
+        parent = os.path.dirname(directory)
+        while parent not in parents and parent != directory:
+            parents.add(parent)
+            directory, parent = parent, os.path.dirname(parent)
+    for directory in directories - parents:
+        os.makedirs(directory, exist_ok=True)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_write_file_atomically, path, content, encoding)
+                   for path, content in targets.items()]
+        for future in futures:
+            future.result()
+    return list(targets)
+
+def remove_file_tree(root):
+    """
+    Remove a whole directory tree.
+    
+    The tree is first renamed to a hidden sibling so it disappears from
+    its original path in one step, then deleted with shutil.rmtree.
+    """
+    root = os.path.abspath(root)
+    parent, name = os.path.split(root)
+    doomed = tempfile.mkdtemp(prefix=f".{name}.", suffix=".deleting", dir=parent)
+    os.rmdir(doomed)
+    os.replace(root, doomed)
+    shutil.rmtree(doomed)
+
+def bulk_directory_operations():
+    """Create and remove a small tree of files in a few calls"""
+    dir_name = "test_tree"
+    manifest = {
+        f"group_{group}/item_{item}.txt": f"Group {group}, item {item}\n"
+        for group in range(3)
+        for item in range(5)
+    }
+    
+    written = create_file_tree(dir_name, manifest)
+    print(f"Created {len(written)} files under {dir_name}")
+    remove_file_tree(dir_name)
+    print(f"Removed directory tree: {dir_name}")
+
+# Caching parsed file contents
+class FileReadCache:
+    """
+    LRU cache of parsed file contents, keyed by path and parser.
+    
+    An entry is reused while the file's (mtime, size) is unchanged. With
+    verify_hash=True the file is also re-read and its content hash
+    compared, which catches edits that keep the same mtime and size but
+    still skips parsing. Entries are evicted least recently used first
+    once their total size exceeds max_bytes. Cached values are shared,
+    so callers should treat them as read-only.
+    """
+    
+    def __init__(self, max_bytes=64 * 1024 * 1024, verify_hash=False):
+        self.max_bytes = max_bytes
+        self.verify_hash = verify_hash
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def _digest(content):
+        return hashlib.blake2b(content, digest_size=16).digest()
+    
+    def get(self, filename, parser, parser_name=None):
+        """
+        Return parser(file_bytes), parsing again only if the file changed.
+        
+        Entries are keyed by parser_name when it is given, otherwise by the
+        parser object itself, so two different lambdas never share an entry.
+        """
+        key = (os.path.abspath(filename), parser if parser_name is None else parser_name)
+        entry = self._entries.get(key)
+        if entry is not None:
+            st = os.stat(filename)
+            if (st.st_mtime_ns, st.st_size) == entry["version"]:
+                if not self.verify_hash or self._read(filename)[0] == entry["digest"]:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry["value"]
+            self._discard(key)
+        
+        self.misses += 1
+        digest, version, content = self._read(filename)
+        value = parser(content)
+        if len(content) <= self.max_bytes:
+            self._entries[key] = {"version": version, "digest": digest,
+                                  "size": len(content), "value": value}
+            self._bytes += len(content)
+            while self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+        return value
+    
+    def _read(self, filename):
+        """Read a file, returning (digest, (mtime_ns, size), content)"""
+        with open(filename, 'rb') as file:
+            st = os.fstat(file.fileno())
+            content = file.read()
+        digest = self._digest(content) if self.verify_hash else None
+        return digest, (st.st_mtime_ns, st.st_size), content
+    
+    def _discard(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry["size"]
+    
+    def read_text(self, filename, encoding="utf-8"):
+        return self.get(filename, lambda content: content.decode(encoding),
+                        f"text:{encoding}")
+    
+    def read_json(self, filename):
+        return self.get(filename, json.loads, "json")
+    
+    def read_csv(self, filename, encoding="utf-8"):
+        def parse(content):
+            return list(csv.reader(io.StringIO(content.decode(encoding), newline='')))
+        return self.get(filename, parse, f"csv:{encoding}")
+    
+    def invalidate(self, filename):
+        """Drop every cached entry for a file"""
+        path = os.path.abspath(filename)
+        for key in [key for key in self._entries if key[0] == path]:
+            self._discard(key)
+    
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+    
+    def stats(self):
+        """Return hit, miss and eviction counts plus current usage"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+# Shared cache used by the readers when called with cached=True
+read_cache = FileReadCache()
+
 # Main execution
 if __name__ == "__main__":
     print("=== File Operations Examples ===\n")
@@ -187,6 +1008,7 @@ if __name__ == "__main__":
     print("1. Text File Operations:")
     write_text_file()
     read_text_file()
+    read_text_file_mapped()
     print()
     
     print("2. Reading file line by line:")
@@ -195,19 +1017,26 @@ if __name__ == "__main__":
     
     print("3. Appending to file:")
     append_to_file()
+    append_with_appender()
     read_text_file()
+    benchmark_append()
     print()
     
     # JSON file operations
     print("4. JSON File Operations:")
     write_json_file()
     read_json_file()
+    read_json_file(compact=True, cached=True)
+    read_json_file(compact=True, cached=True)
+    print(f"Read cache stats: {read_cache.stats()}")
+    json_lines_examples()
     print()
     
     # CSV file operations
     print("5. CSV File Operations:")
     write_csv_file()
     read_csv_file()
+    read_csv_typed()
     print()
     
     # File system operations
@@ -217,15 +1046,18 @@ if __name__ == "__main__":
     
     print("7. Directory Listing:")
     list_directory()
+    records, totals = scan_directory_parallel('.')
+    print(f"Parallel scan of the whole tree: {totals}")
     print()
     
     print("8. Directory Operations:")
     directory_operations()
+    bulk_directory_operations()
     print()
     
     # Clean up created files
     print("9. Cleanup:")
-    files_to_remove = ["sample.txt", "data.json", "students.csv"]
+    files_to_remove = ["sample.txt", "data.json", "records.jsonl", "students.csv"]
     for filename in files_to_remove:
         if os.path.exists(filename):
             os.remove(filename)
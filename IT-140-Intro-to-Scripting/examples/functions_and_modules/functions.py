@@ -1,6 +1,146 @@
 # Functions in Python
 # This script demonstrates function definition, parameters, and usage
 
+import copy
+import functools
+import json
+import math
+import operator
+import pickle
+import random
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import field, make_dataclass
+from itertools import repeat
+from numbers import Real
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure Python paths still work
+    np = None
+
+# Optional call profiling for the helpers in this module
+PROFILE_SAMPLE_SIZE = 10_000
+_profiling_enabled = False
+_profile_registry = {}
+
+class CallStats:
+    """Call count, timing and argument-size statistics for one function"""
+    
+    __slots__ = ("name", "calls", "total_ns", "max_ns", "samples",
+                 "total_arg_size", "max_arg_size")
+    
+    def __init__(self, name):
+        self.name = name
+        self.reset()
+    
+    def reset(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.samples = []
+        self.total_arg_size = 0
+        self.max_arg_size = 0
+    
+    def record(self, elapsed_ns, arg_size):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        self.total_arg_size += arg_size
+        self.max_arg_size = max(self.max_arg_size, arg_size)
+        # Reservoir sampling keeps the latency sample bounded but unbiased
+        if len(self.samples) < PROFILE_SAMPLE_SIZE:
+            self.samples.append(elapsed_ns)
+        else:
+            slot = random.randrange(self.calls)
+            if slot < PROFILE_SAMPLE_SIZE:
+                self.samples[slot] = elapsed_ns
+    
+    def percentile(self, percent):
+        """Return the given latency percentile in nanoseconds"""
+        if not self.samples:
+            return 0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percent / 100))
+        return ordered[index]
+    
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.calls / 1e3 if self.calls else 0.0,
+            "p50_us": self.percentile(50) / 1e3,
+            "p95_us": self.percentile(95) / 1e3,
+            "p99_us": self.percentile(99) / 1e3,
+            "max_us": self.max_ns / 1e3,
+            "mean_arg_size": self.total_arg_size / self.calls if self.calls else 0.0,
+            "max_arg_size": self.max_arg_size,
+        }
+
+def _argument_size(args, kwargs):
+    """Count the items in sized arguments, treating other arguments as 1"""
+    size = 0
+    for value in (*args, *kwargs.values()):
+        try:
+            size += len(value)
+        except TypeError:
+            size += 1
+    return size
+
+def profiled(func):
+    """
+    Record calls to func in the profile registry while profiling is enabled.
+    
+    The wrapper replaces func everywhere it is imported, so callers that
+    did "from functions import factorial" are profiled too. When
+    profiling is disabled it only checks one flag before calling func.
+    """
+    stats = _profile_registry.setdefault(func.__qualname__, CallStats(func.__qualname__))
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _profiling_enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.record(time.perf_counter_ns() - start, _argument_size(args, kwargs))
+    
+    return wrapper
+
+def enable_profiling():
+    global _profiling_enabled
+    _profiling_enabled = True
+
+def disable_profiling():
+    global _profiling_enabled
+    _profiling_enabled = False
+
+def reset_profile_stats():
+    for stats in _profile_registry.values():
+        stats.reset()
+
+def profile_stats():
+    """Return the recorded statistics of every called function as a dict"""
+    return {name: stats.to_dict() for name, stats in _profile_registry.items() if stats.calls}
+
+def profile_stats_json(indent=None):
+    return json.dumps(profile_stats(), indent=indent)
+
+def profile_report():
+    """Return a text table of the profiled functions, slowest total first"""
+    stats = sorted(profile_stats().items(), key=lambda item: item[1]["total_ms"], reverse=True)
+    lines = [f"{'function':<20} {'calls':>8} {'total ms':>10} {'p50 us':>9} "
+             f"{'p95 us':>9} {'p99 us':>9} {'avg args':>9}"]
+    for name, row in stats:
+        lines.append(f"{name:<20} {row['calls']:>8} {row['total_ms']:>10.3f} "
+                     f"{row['p50_us']:>9.2f} {row['p95_us']:>9.2f} "
+                     f"{row['p99_us']:>9.2f} {row['mean_arg_size']:>9.1f}")
+    return "\n".join(lines)
+
 # Basic function
 def greet():
     """Simple greeting function"""
@@ -22,6 +162,7 @@ def greet_with_city(name, city="Unknown"):
     print(f"Hello, {name}! You are from {city}.")
 
 # Function with return value
+@profiled
 def add_numbers(a, b):
     """Add two numbers and return the result"""
     return a + b
@@ -34,6 +175,7 @@ def get_name_and_age():
     return name, age
 
 # Function with variable number of arguments (*args)
+@profiled
 def sum_all(*numbers):
     """Sum all provided numbers"""
     total = 0
@@ -41,6 +183,23 @@ def sum_all(*numbers):
         total += num
     return total
 
+# Summing any iterable, buffer or array
+def sum_values(values, exact=False):
+    """
+    Sum the numbers in any iterable, buffer, array.array or NumPy array.
+    
+    Generators are consumed one item at a time, so nothing is copied into
+    memory. NumPy arrays are summed with ndarray.sum(). exact=True uses
+    math.fsum, which returns the correctly rounded float total instead of
+    accumulating rounding error.
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        return math.fsum(values.ravel()) if exact else values.sum().item()
+    if not isinstance(values, array) and not hasattr(values, "__iter__"):
+        # Plain buffers such as bytes-like objects are read through a memoryview
+        values = memoryview(values)
+    return math.fsum(values) if exact else sum(values)
+
 # Function with keyword arguments (**kwargs)
 def create_profile(**info):
     """Create a profile with keyword arguments"""
@@ -49,31 +208,329 @@ def create_profile(**info):
         profile[key] = value
     return profile
 
+# Marking functions that also work on whole NumPy arrays
+def vectorizable(func):
+    """Mark func as safe to call once on a whole array instead of per item"""
+    func.vectorizable = True
+    return func
+
+# Compact profile records with a fixed schema
+class ProfileRecord:
+    """
+    Base class for profile types made by make_profile_type().
+    
+    Instances store their fields in __slots__ instead of a per-instance
+    dict, but still support dict-style access such as profile["name"],
+    get(), keys(), items() and to_dict().
+    """
+    
+    __slots__ = ()
+    _fields = ()
+    
+    def __getitem__(self, key):
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key, value):
+        if key not in self._fields:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key):
+        return key in self._fields
+    
+    def __iter__(self):
+        return iter(self._fields)
+    
+    def __len__(self):
+        return len(self._fields)
+    
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self._fields else default
+    
+    def keys(self):
+        return self._fields
+    
+    def values(self):
+        return tuple(getattr(self, key) for key in self._fields)
+    
+    def items(self):
+        return zip(self._fields, self.values())
+    
+    def to_dict(self):
+        return dict(self.items())
+    
+    @classmethod
+    def from_rows(cls, rows):
+        """Build one record per row of values given in field order"""
+        return [cls(*row) for row in rows]
+    
+    @classmethod
+    def from_dicts(cls, rows):
+        """Build one record per dict of field values"""
+        return [cls(**row) for row in rows]
+
+def _profile_field(default):
+    """Build a dataclass field, copying unhashable (mutable) defaults per instance"""
+    if type(default).__hash__ is None:
+        return field(default_factory=functools.partial(copy.copy, default))
+    return field(default=default)
+
+def make_profile_type(fields, name="Profile", defaults=None):
+    """
+    Create a slot-based profile class for a fixed list of field names.
+    
+    Fields missing when a profile is created take their value from
+    defaults, or None if they have no default. Mutable defaults such as
+    lists and dicts are copied for each new profile. Unknown fields raise
+    TypeError, just like an unexpected keyword argument.
+    """
+    defaults = defaults or {}
+    unknown = set(defaults) - set(fields)
+    if unknown:
+        raise ValueError(f"Defaults given for unknown fields: {sorted(unknown)}")
+    reserved = [key for key in fields if hasattr(ProfileRecord, key)]
+    if reserved:
+        raise ValueError(f"Field names clash with ProfileRecord attributes: {reserved}")
+    profile_type = make_dataclass(
+        name,
+        [(key, object, _profile_field(defaults.get(key))) for key in fields],
+        bases=(ProfileRecord,),
+        slots=True,
+    )
+    profile_type._fields = tuple(fields)
+    return profile_type
+
 # Lambda functions (anonymous functions)
-square = lambda x: x ** 2
+square = vectorizable(lambda x: x ** 2)
 add = lambda x, y: x + y
 
 # Higher-order function (function that takes another function as parameter)
-def apply_operation(numbers, operation):
-    """Apply an operation to a list of numbers"""
-    results = []
-    for num in numbers:
-        results.append(operation(num))
-    return results
+APPLY_BACKENDS = ("auto", "python", "numpy", "process", "lazy")
+NUMPY_MIN_SIZE = 10_000
+
+def _apply_chunk(operation, chunk):
+    """Apply operation to one chunk of items (runs inside a worker process)"""
+    return list(map(operation, chunk))
+
+def _is_picklable(operation):
+    try:
+        pickle.dumps(operation)
+    except Exception:
+        return False
+    return True
+
+def _choose_backend(numbers, operation):
+    """Pick an eager backend whose values match the Python loop apart from overflow"""
+    if np is not None and getattr(operation, "vectorizable", False):
+        # Only float64 buffers are moved to NumPy: Python ints could wrap
+        # in int64, and array('f') would be computed in float32
+        if isinstance(numbers, np.ndarray):
+            return "numpy"
+        if (isinstance(numbers, array) and numbers.typecode == "d"
+                and len(numbers) >= NUMPY_MIN_SIZE):
+            return "numpy"
+    return "python"
+
+@profiled
+def apply_operation(numbers, operation, backend="auto", chunk_size=100_000,
+                    max_workers=None):
+    """
+    Apply an operation to a list of numbers.
+    
+    backend picks how the work runs:
+    "python" maps the operation over the items in this process,
+    "numpy" calls a vectorizable operation once on the whole array,
+    "process" splits the items into chunks for a ProcessPoolExecutor,
+    and "lazy" returns an iterator that applies the operation on demand.
+    "auto" picks "numpy" for NumPy arrays and large array('d') buffers
+    and "python" otherwise; "process" runs the operation in child
+    processes, so it is only used when asked for. NumPy arrays come
+    back as arrays; everything else returns a list unless "lazy" is
+    asked for. Float overflow differs between backends: NumPy returns
+    inf with a RuntimeWarning where Python raises OverflowError.
+    """
+    if backend not in APPLY_BACKENDS:
+        raise ValueError(f"backend must be one of {APPLY_BACKENDS}")
+    if backend == "auto":
+        backend = _choose_backend(numbers, operation)
+    
+    if backend == "lazy":
+        return map(operation, numbers)
+    if backend == "numpy":
+        if np is None:
+            raise ImportError("The numpy backend requires NumPy to be installed")
+        results = operation(np.asarray(numbers))
+        return results if isinstance(numbers, np.ndarray) else results.tolist()
+    if backend == "process":
+        if not _is_picklable(operation):
+            raise ValueError("The process backend needs a module-level function, not a lambda")
+        items = list(numbers)
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for chunk_results in executor.map(_apply_chunk, repeat(operation), chunks):
+                results.extend(chunk_results)
+        return results
+    return list(map(operation, numbers))
 
 # Recursive function
-def factorial(n):
-    """Calculate factorial recursively"""
+def factorial_recursive(n):
+    """Calculate factorial recursively (fails with RecursionError for large n)"""
     if n <= 1:
         return 1
     else:
-        return n * factorial(n - 1)
+        return n * factorial_recursive(n - 1)
+
+# Factorial engine: iterative, divide-and-conquer and memoized
+FACTORIAL_SMALL_LIMIT = 64
+FACTORIAL_MEMO_SIZE = 32
+_factorial_memo = OrderedDict()
+
+def _range_product(low, high):
+    """Multiply the integers low..high using a balanced divide-and-conquer split"""
+    if high < low:
+        return 1
+    if high - low < 16:
+        result = low
+        for i in range(low + 1, high + 1):
+            result *= i
+        return result
+    middle = (low + high) // 2
+    return _range_product(low, middle) * _range_product(middle + 1, high)
+
+def _remember_factorial(n, value):
+    """Store a factorial in the bounded memo table, dropping the oldest entry"""
+    _factorial_memo[n] = value
+    _factorial_memo.move_to_end(n)
+    if len(_factorial_memo) > FACTORIAL_MEMO_SIZE:
+        _factorial_memo.popitem(last=False)
+
+@profiled
+def factorial(n):
+    """
+    Calculate n! without recursion limits.
+    
+    Small n uses a plain loop. Larger n multiplies balanced halves of the
+    range, which keeps the big integers the same size and is much faster
+    than multiplying one term at a time. Results are kept in a bounded
+    memo table, and the closest smaller memoized value is used as a
+    starting point.
+    """
+    if not isinstance(n, int):
+        raise TypeError("factorial() only accepts integers")
+    if n < 0:
+        raise ValueError("factorial() is not defined for negative numbers")
+    if n <= FACTORIAL_SMALL_LIMIT:
+        result = 1
+        for i in range(2, n + 1):
+            result *= i
+        return result
+    
+    if n in _factorial_memo:
+        _factorial_memo.move_to_end(n)
+        return _factorial_memo[n]
+    
+    start, result = 1, 1
+    for known in _factorial_memo:
+        if start < known < n:
+            start, result = known, _factorial_memo[known]
+    result *= _range_product(start + 1, n)
+    _remember_factorial(n, result)
+    return result
+
+def factorials(values):
+    """
+    Calculate the factorial of every value in one pass.
+    
+    The values are handled in increasing order, and each result is built
+    from the previous one times the product of the numbers in between.
+    Results come back in the same order as the input.
+    """
+    values = list(values)
+    for n in values:
+        if not isinstance(n, int):
+            raise TypeError("factorials() only accepts integers")
+        if n < 0:
+            raise ValueError("factorial() is not defined for negative numbers")
+    
+    results = {}
+    previous, product = 0, 1
+    for n in sorted(set(values)):
+        product *= _range_product(previous + 1, n)
+        results[n] = product
+        previous = n
+    return [results[n] for n in values]
 
 # Function with type hints (Python 3.5+)
 def calculate_area(length: float, width: float) -> float:
     """Calculate area of rectangle with type hints"""
     return length * width
 
+# Batched version for many rectangles at once
+def calculate_areas(lengths, widths):
+    """
+    Calculate the areas of many rectangles from columns of lengths and widths.
+    
+    Inputs can be sequences, array.array or NumPy arrays, and their types
+    and shapes are checked for the whole batch rather than per rectangle.
+    Non-numeric values raise TypeError. NumPy inputs are multiplied in one vectorized operation
+    and return a NumPy array. array.array inputs return array('d'), and
+    other sequences return a list.
+    """
+    if np is not None and (isinstance(lengths, np.ndarray) or isinstance(widths, np.ndarray)):
+        lengths = np.asarray(lengths)
+        widths = np.asarray(widths)
+        # Check the dtypes first; converting with dtype=float would parse strings
+        if lengths.dtype.kind not in "iuf" or widths.dtype.kind not in "iuf":
+            raise TypeError("Lengths and widths must contain only numbers")
+        lengths = lengths.astype(float, copy=False)
+        widths = widths.astype(float, copy=False)
+        if lengths.shape != widths.shape:
+            raise ValueError(f"Shape mismatch: {lengths.shape} vs {widths.shape}")
+        return lengths * widths
+    
+    for column in (lengths, widths):
+        if isinstance(column, (str, bytes)) or not hasattr(column, "__len__"):
+            raise TypeError("Lengths and widths must be sequences or arrays of numbers")
+    if len(lengths) != len(widths):
+        raise ValueError(f"Length mismatch: {len(lengths)} lengths vs {len(widths)} widths")
+    
+    areas = list(map(operator.mul, lengths, widths))
+    # Totalling the areas checks the element types in one C-level pass:
+    # a string, list or tuple product such as "2" * 3 cannot be added to
+    # a number, and complex or Decimal values leave a non-Real total
+    try:
+        total = sum(areas)
+    except TypeError:
+        total = None
+    if not isinstance(total, Real):
+        raise TypeError("Lengths and widths must contain only numbers")
+    if isinstance(lengths, array) or isinstance(widths, array):
+        return array("d", areas)
+    return list(areas)
+
+def _best_time(func, repeat):
+    """Return the fastest of several timed calls"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_calculate_area(sizes=(1_000, 100_000, 1_000_000), repeat=5):
+    """Compare calculate_area in a Python loop with calculate_areas at several sizes"""
+    print(f"{'size':>10} {'scalar (s)':>12} {'batched (s)':>12} {'speedup':>8}")
+    for size in sizes:
+        lengths = [float(i % 100 + 1) for i in range(size)]
+        widths = [float(i % 37 + 1) for i in range(size)]
+        scalar = _best_time(
+            lambda: [calculate_area(l, w) for l, w in zip(lengths, widths)], repeat)
+        batched = _best_time(lambda: calculate_areas(lengths, widths), repeat)
+        print(f"{size:>10} {scalar:>12.6f} {batched:>12.6f} {scalar / batched:>7.1f}x")
+
 # Main execution
 if __name__ == "__main__":
     print("=== Function Examples ===\n")
@@ -99,10 +556,21 @@ if __name__ == "__main__":
     print(f"Sum of 1,2,3,4,5: {total1}")
     print(f"Sum of 10,20: {total2}")
     
+    # Summing a stream without building a tuple first
+    total3 = sum_values(0.1 for _ in range(10))
+    total4 = sum_values((0.1 for _ in range(10)), exact=True)
+    print(f"Sum of ten 0.1 values: {total3} (exact: {total4})")
+    
     # Keyword arguments
     profile = create_profile(name="Alice", age=25, city="Boston", job="Engineer")
     print(f"Profile: {profile}")
     
+    # Schema-backed profiles use __slots__ instead of one dict per profile
+    Profile = make_profile_type(["name", "age", "city", "job"])
+    profiles = Profile.from_rows([("Alice", 25, "Boston", "Engineer"), ("Bob", 30, "Denver")])
+    print(f"Compact profile: {profiles[0].to_dict()}")
+    print(f"Bob's job (not given): {profiles[1]['job']}")
+    
     # Lambda functions
     print(f"Square of 5: {square(5)}")
     print(f"Add 3 and 7: {add(3, 7)}")
@@ -112,16 +580,38 @@ if __name__ == "__main__":
     squared_numbers = apply_operation(numbers, square)
     print(f"Original numbers: {numbers}")
     print(f"Squared numbers: {squared_numbers}")
+    lazy_squares = apply_operation(iter(numbers), square, backend="lazy")
+    print(f"Squared lazily: {list(lazy_squares)}")
     
     # Recursive function
-    fact_5 = factorial(5)
+    fact_5 = factorial_recursive(5)
     print(f"5! = {fact_5}")
     
+    # Factorial engine handles large n without recursion
+    print(f"1000! has {len(str(factorial(1000)))} digits")
+    print(f"Factorials of 3, 5 and 10: {factorials([3, 5, 10])}")
+    
     # Type hints function
     area = calculate_area(5.5, 3.2)
     print(f"Area of rectangle (5.5 x 3.2): {area}")
+    
+    # Batched areas for many rectangles at once
+    areas = calculate_areas([5.5, 2, 10], [3.2, 4, 0.5])
+    print(f"Areas of three rectangles: {areas}")
+    benchmark_calculate_area(sizes=(1_000, 10_000), repeat=3)
+    
+    # Profiling the helpers decorated with @profiled
+    enable_profiling()
+    for n in range(200):
+        add_numbers(n, n)
+        sum_all(*range(n))
+        factorial(n)
+    apply_operation(list(range(10_000)), square)
+    disable_profiling()
+    print(f"\nProfile report:\n{profile_report()}")
 
 # Function documentation example
+@profiled
 def complex_function(param1, param2=None, *args, **kwargs):
     """
     A complex function demonstrating various parameter types.